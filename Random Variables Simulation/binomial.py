@@ -1,21 +1,61 @@
 from random import random
-from math import comb
+from math import exp, lgamma, log
+from functools import lru_cache
+import numpy as np
 
 def binomial_mass(x: int, n: int, p: float) -> float:
     """
-    Calculates the probability mass function of a binomial distribution, given x, n and p
+    Calculates the binomial probability mass function in log space, given x, n and p
     """
-    return comb(n, x)*(p**x)*((1 - p)**(n - x)) if 0 <= x <= n else 0
+    if not 0 <= x <= n:
+        return 0.0
+    if p <= 0:
+        return 1.0 if x == 0 else 0.0
+    if p >= 1:
+        return 1.0 if x == n else 0.0
+
+    log_comb = lgamma(n + 1) - lgamma(x + 1) - lgamma(n - x + 1)
+    return exp(log_comb + x*log(p) + (n - x)*log(1 - p))
+
+@lru_cache(maxsize=128)
+def _binomial_cdf(n: int, p: float) -> np.ndarray:
+    """
+    Calculates the binomial cumulative distribution vector, given n and p
+    """
+    pmf = np.zeros(n + 1)
+
+    if p <= 0:
+        pmf[0] = 1.0
+    elif p >= 1:
+        pmf[n] = 1.0
+    else:
+        mode = min(int((n + 1)*p), n)
+        # Starts at the mode so that (1 - p)**n underflowing for large n does not
+        # zero out the whole vector
+        pmf[mode] = binomial_mass(mode, n, p)
+
+        for i in range(mode, n):
+            pmf[i + 1] = pmf[i]*(n - i)*p/((i + 1)*(1 - p))
+        for i in range(mode, 0, -1):
+            pmf[i - 1] = pmf[i]*i*(1 - p)/((n - i + 1)*p)
+
+    cdf = np.cumsum(pmf)
+    cdf.flags.writeable = False
+
+    return cdf
 
 def binomial_simulation(n: int, p: float) -> int:
     """
     Simulates a binomial random variable with parameters n and p using the inverse transform method
     """
-    num = random() 
-    prob = 0
+    cdf = _binomial_cdf(n, p)
+
+    return min(int(np.searchsorted(cdf, random(), side='right')), n)
 
-    for i in range(n + 1):
-        prob += binomial_mass(i, n, p) 
+def binomial_simulation_batch(n: int, p: float, size: int) -> np.ndarray:
+    """
+    Simulates size binomial random variables with parameters n and p
+    """
+    cdf = _binomial_cdf(n, p)
 
-        if num < prob:
-            return i
\ No newline at end of file
+    return np.minimum(np.searchsorted(cdf, np.random.random(size), side='right'), n)
@@ -1,5 +1,27 @@
 from math import log
-from random import random
+from collections.abc import Callable, Iterator
+import numpy as np
+
+_rng = np.random.default_rng()
+
+def buffered_samples(
+    draw: Callable[[int], np.ndarray], size: int = 4096
+) -> Iterator[float]:
+    """
+    Yields samples one at a time from batches of the given size generated by draw
+    """
+    while True:
+        yield from draw(size).tolist()
+
+_standard_exp_samples = buffered_samples(_rng.standard_exponential)
+
+def seed(value: int | np.random.SeedSequence) -> None:
+    """
+    Seeds the numpy generator used by exp_simulation and exp_batch
+    """
+    global _rng, _standard_exp_samples
+    _rng = np.random.default_rng(value)
+    _standard_exp_samples = buffered_samples(_rng.standard_exponential)
 
 def exp_dist_inverse(u: float, lambda_: float) -> float:
     """
@@ -9,6 +31,12 @@ def exp_dist_inverse(u: float, lambda_: float) -> float:
 
 def exp_simulation(lambda_: float) -> float:
     """
-    Simulates an exponential random variable with parameter lambda using the inverse transform method
+    Simulates an exponential random variable with parameter lambda from a numpy buffer
+    """
+    return next(_standard_exp_samples)/lambda_
+
+def exp_batch(lambda_: float, n: int) -> np.ndarray:
+    """
+    Simulates n exponential random variables with parameter lambda using default_rng
     """
-    return exp_dist_inverse(random(), lambda_)
\ No newline at end of file
+    return _rng.exponential(1.0/lambda_, size=n)
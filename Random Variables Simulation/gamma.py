@@ -1,6 +1,8 @@
 from random import random
-from math import exp
-from exponential import exp_simulation
+from math import exp, log1p
+
+# c = max f(x)/g(x), attained at x = 4
+_C = 16*exp(-2)
 
 def f(x: float) -> float:
     """
@@ -18,11 +20,11 @@ def gamma_3_1_simulation() -> float:
     """
     Simulates a gamma(3,1) random variable using the acceptance-rejection method
     """
-    c = 16*exp(-2)
-
     while True:
-        num_sim = exp_simulation(1/2)
+        # Exponential(1/2) proposal by the inverse transform, -log(1 - U)/(1/2)
+        num_sim = -2.0*log1p(-random())
         U = random()
 
-        if U < f(num_sim)/(g(num_sim)*c):
+        # U < f(x)/(g(x)*c) rewritten as U*c < x**2*exp(-x/2), which needs a single exp
+        if U*_C < num_sim*num_sim*exp(-0.5*num_sim):
             return num_sim
\ No newline at end of file
@@ -0,0 +1,48 @@
+from math import exp, log1p
+from random import random
+from random import seed as _seed
+
+import numba as nb
+from gamma import _C
+
+# Built from gamma_fast.pyx with setup.py; optional, numba is used without it
+try:
+    import gamma_fast
+except ImportError:
+    gamma_fast = None
+
+@nb.njit(cache=True)
+def _seed_jit(value: int) -> None:
+    _seed(value)
+
+def seed(value: int) -> None:
+    """
+    Seeds the random number generator used by gamma_3_1_simulation
+    """
+    if gamma_fast is not None:
+        gamma_fast.seed(value)
+    else:
+        _seed_jit(value)
+
+@nb.njit(cache=True, fastmath=True)
+def _gamma_3_1_simulation_jit() -> float:
+    """
+    Simulates a gamma(3,1) random variable by acceptance-rejection, compiled with numba
+    """
+    while True:
+        num_sim = -2.0*log1p(-random())
+        U = random()
+
+        # f(x)/(g(x)*c) simplifies to x**2*exp(-x/2)/c
+        if U*_C < num_sim*num_sim*exp(-0.5*num_sim):
+            return num_sim
+
+def gamma_3_1_simulation() -> float:
+    """
+    Simulates a gamma(3,1) random variable, drawing uniforms from gamma_fast's own
+    generator when it is built and from numba's internal generator otherwise
+    """
+    if gamma_fast is not None:
+        return gamma_fast.gamma_3_1_simulation()
+
+    return _gamma_3_1_simulation_jit()
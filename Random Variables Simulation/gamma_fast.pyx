@@ -0,0 +1,43 @@
+# cython: language_level=3
+# Compiled version of gamma_3_1_simulation from gamma_3_1_jit.py.
+# Build in place with:
+#
+#     python setup.py build_ext --inplace
+
+cimport cython
+from libc.math cimport exp, log1p
+from libc.stdint cimport uint64_t
+
+from lcg48 cimport seed_state, uniform
+
+import os
+
+import gamma
+
+cdef double _C = gamma._C
+cdef uint64_t _state
+
+def seed(value):
+    """
+    Seeds the generator used by the compiled simulation
+    """
+    global _state
+    _state = seed_state(value & 0xFFFFFFFF)
+
+# Seeded from the operating system on import; call seed() to make a run reproducible
+seed(int.from_bytes(os.urandom(4), "little"))
+
+@cython.cdivision(True)
+def gamma_3_1_simulation():
+    """
+    Simulates a gamma(3,1) random variable using the acceptance-rejection method with an
+    exponential(1/2) proposal. The ratio f(x)/(g(x)*c) simplifies to x**2*exp(-x/2)/c
+    """
+    cdef double num_sim, U
+
+    while True:
+        num_sim = -2.0*log1p(-uniform(&_state))
+        U = uniform(&_state)
+
+        if U*_C < num_sim*num_sim*exp(-0.5*num_sim):
+            return num_sim
@@ -1,4 +1,5 @@
 from random import random
+from math import ceil, log
 
 def geometric_mass(x: int, p: float) -> float:
     """
@@ -10,12 +11,10 @@ def geometric_simulation(p: float) -> int:
     """
     Simulates a geometric random variable with parameter p using the inverse transform method
     """
-    num = random() 
-    prob = 0
+    if p >= 1:
+        return 1
 
-    x = 1
-    while not num < prob:
-        prob += geometric_mass(x, p)
-        x += 1
+    num = random()
 
-    return x
\ No newline at end of file
+    # Closed-form inverse of the cumulative distribution function
+    return max(1, ceil(log(1.0 - num)/log(1.0 - p)))
@@ -5,11 +5,20 @@
 # into the same fund for reinvestment. The fund generates random monthly
 # returns according to a Beta(1, 6) distribution.
 
-from random import random
 import pandas as pd
 import numpy as np
+import numba as nb
 from scipy.stats import norm
-from exponential import exp_simulation
+from exponential import buffered_samples, exp_batch
+from exponential import seed as _seed_exponential
+
+# Optional Cython build of accumulated_saved_simulation and sample_final (see setup.py)
+try:
+  import invest_fast
+except ImportError:
+  invest_fast = None
+
+_rng = np.random.default_rng()
 
 def beta_dist_1_6_inverse(u: float) -> float:
   """
@@ -17,65 +26,166 @@ def beta_dist_1_6_inverse(u: float) -> float:
   """
   return 1 - (1 - u)**(1/6) if 0 <= u <= 1 else 0
 
+def beta16_batch(n: int) -> np.ndarray:
+  """
+  Simulates n beta(1,6) random variables with numpy's default_rng
+  """
+  return _rng.beta(1.0, 6.0, size=n)
+
+_beta_1_6_samples = buffered_samples(beta16_batch)
+
 def beta_dist_1_6_simulation() -> float:
   """
-  Simulates a beta(1,6) random variable using the inverse transform method
+  Simulates a beta(1,6) random variable from a buffer filled by numpy's default_rng
+  """
+  return next(_beta_1_6_samples)
+
+@nb.njit(cache=True, fastmath=True)
+def _accumulate(
+  saved: np.ndarray, return_: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+  """
+  Calculates the return generated and the accumulated value of the fund at the end of
+  each month, given the monthly savings and rates of return
   """
-  return beta_dist_1_6_inverse(random())
+  n = saved.shape[0]
+  generated = np.empty(n)
+  accumulated = np.empty(n)
+  valor_acumulado = 0.0
+
+  for i in range(n):
+    generated[i] = (valor_acumulado + saved[i])*return_[i]
+    valor_acumulado = (valor_acumulado + saved[i])*(1.0 + return_[i])
+    accumulated[i] = valor_acumulado
+
+  return generated, accumulated
 
 def investment_simulation(months: int) -> pd.DataFrame:
   """
   Simulates an investment for a given number of months
   """
-  df = {'month': [], 'saved': [], 'return': [], 'generated': [], 'accumulated': []}
+  month = np.arange(1, months + 1, dtype=np.int64)
+  saved = exp_batch(1/1000, months)
+  return_ = beta16_batch(months)
 
-  valor_acumulado = 0
+  generated, accumulated = _accumulate(saved, return_)
 
-  for month in range(1, months + 1):
-    df['month'].append(month)
+  return pd.DataFrame({
+    'month': month,
+    'saved': saved,
+    'return': return_,
+    'generated': generated,
+    'accumulated': accumulated,
+  }, copy=False)
 
-    ahorrado = exp_simulation(1/1000)
-    df['saved'].append(ahorrado)
+def accumulated_saved_simulation(months: int) -> float:
+  """
+  Simulates the accumulated value after a given number of months, drawing from
+  invest_fast's generator when it is built and from numpy's default_rng otherwise
+  """
+  if invest_fast is not None:
+    return invest_fast.accumulated_saved_simulation(months)
 
-    return_ = beta_dist_1_6_simulation()
-    df['return'].append(return_)
+  saved = exp_batch(1/1000, months)
+  rate_of_return = beta16_batch(months)
+  _, accumulated = _accumulate(saved, rate_of_return)
 
-    generated = (valor_acumulado + ahorrado)*return_
-    df['generated'].append(generated)
+  return accumulated[-1] if months > 0 else 0.0
 
-    valor_acumulado = (valor_acumulado + ahorrado)*(1 + return_)
-    df['accumulated'].append(valor_acumulado)
+@nb.njit(cache=True)
+def _seed_jit(value: int) -> None:
+  np.random.seed(value)
 
-  return pd.DataFrame(df)
+def seed(value: int) -> None:
+  """
+  Seeds the generators used by the simulations in this module
+  """
+  global _rng, _beta_1_6_samples
 
-def accumulated_saved_simulation(months: int):
-  accumulated = 0
+  # Independent streams for the savings and the returns; seeding both generators with
+  # the same value would make the beta draws reuse the exponential ones
+  exp_stream, beta_stream = np.random.SeedSequence(value).spawn(2)
+  _seed_exponential(exp_stream)
+  _rng = np.random.default_rng(beta_stream)
+  _beta_1_6_samples = buffered_samples(beta16_batch)
+  _seed_jit(value)
 
-  for month in range(1, months + 1):
-    saved = exp_simulation(1/1000)
-    rate_of_return = beta_dist_1_6_simulation()
-    accumulated = (accumulated + saved)*(1 + rate_of_return)
+  if invest_fast is not None:
+    invest_fast.seed(value)
 
-  return accumulated
+@nb.njit(cache=True, parallel=True, fastmath=True)
+def _sample_final(n: int, months: int) -> np.ndarray:
+  """
+  Simulates n independent investments in parallel and returns the accumulated value
+  of each one after the given number of months
+  """
+  out = np.empty(n)
 
-def accumulated_saved_average_simulation(confidence: float):
-  accumulated = np.array([])
+  for i in nb.prange(n):
+    accumulated = 0.0
 
-  coef_conf = 1 - confidence
-  z = norm.ppf(1 - coef_conf/2)
+    for _ in range(months):
+      saved = np.random.exponential(1000.0)
+      rate_of_return = np.random.beta(1.0, 6.0)
+      accumulated = (accumulated + saved)*(1.0 + rate_of_return)
 
-  error = 10000
+    out[i] = accumulated
 
-  while error > 5000:
-    accumulated_final = accumulated_saved_simulation(36)
+  return out
+
+def accumulated_saved_sample(n: int, months: int) -> np.ndarray:
+  """
+  Simulates the accumulated value after a given number of months for n investments in
+  parallel, with invest_fast when it is built and with numba's per-thread generators
+  otherwise
+  """
+  if invest_fast is not None:
+    return np.frombuffer(invest_fast.sample_final(n, months), dtype=np.float64)
+
+  return _sample_final(n, months)
+
+@nb.njit(cache=True)
+def _welford_update(
+  chunk: np.ndarray, n: int, mean: float, M2: float, z: float, error: float,
+  max_error: float
+):
+  """
+  Updates the running mean and sum of squared deviations with Welford's method, one
+  simulation of the chunk at a time, and stops as soon as the error is at most max_error
+  """
+  for x in chunk:
+    n += 1
+    delta = x - mean
+    mean += delta/n
+    M2 += delta*(x - mean)
 
-    accumulated = np.append(accumulated, accumulated_final)
+    # Sample standard deviation, defined once there are at least two simulations
+    if n > 1:
+      error = z*(M2/(n - 1))**0.5/n**0.5
 
-    n = len(accumulated)
+      if error <= max_error:
+        break
 
-    mean = np.mean(accumulated)
-    s = np.std(accumulated)
+  return n, mean, M2, error
 
-    error = z * s / (n ** 0.5) if n > 1 else error
+def accumulated_saved_average_simulation(confidence: float, chunk_size: int = 1024):
+  """
+  Estimates the mean accumulated value after 36 months until the error at the given
+  confidence is at most 5000, using accumulated_saved_sample for the simulations
+  """
+  coef_conf = 1 - confidence
+  z = norm.ppf(1 - coef_conf/2)
+
+  error = 10000.0
+
+  n = 0
+  mean = 0.0
+  M2 = 0.0
+
+  # Simulations are drawn in parallel chunks; the stopping rule is still checked after
+  # each one, so n is the same as when simulating one at a time
+  while error > 5000:
+    chunk = accumulated_saved_sample(chunk_size, 36)
+    n, mean, M2, error = _welford_update(chunk, n, mean, M2, z, error, 5000.0)
 
-  return mean, error, n
\ No newline at end of file
+  return mean, error, n
@@ -0,0 +1,25 @@
+# The 48-bit linear congruential generator behind drand48/erand48, written inline so that
+# every caller owns its state: each compiled module keeps its own, and every parallel
+# simulation in invest_fast.sample_final gets a private one. libc's drand48 shares a single
+# process-wide state and erand48 is not thread-safe on all platforms.
+
+from libc.stdint cimport uint64_t
+
+cdef inline uint64_t seed_state(uint64_t value) noexcept nogil:
+    # Same initial state as srand48(value)
+    return ((value & 0xFFFFFFFFULL) << 16) | 0x330EULL
+
+cdef inline uint64_t next_state(uint64_t *state) noexcept nogil:
+    state[0] = (0x5DEECE66DULL*state[0] + 0xBULL) & 0xFFFFFFFFFFFFULL
+    return state[0]
+
+cdef inline double uniform(uint64_t *state) noexcept nogil:
+    # Uniform in [0, 1), like erand48
+    return next_state(state)/281474976710656.0
+
+cdef inline uint64_t spawn_state(uint64_t base, uint64_t index) noexcept nogil:
+    # splitmix64 of base + index, so that neighbouring streams do not overlap
+    cdef uint64_t x = base + index + 0x9E3779B97F4A7C15ULL
+    x = (x ^ (x >> 30))*0xBF58476D1CE4E5B9ULL
+    x = (x ^ (x >> 27))*0x94D049BB133111EBULL
+    return (x ^ (x >> 31)) & 0xFFFFFFFFFFFFULL
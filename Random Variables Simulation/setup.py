@@ -0,0 +1,28 @@
+import sys
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+# OpenMP makes the prange loop in invest_fast.sample_final run on every core; Apple's
+# clang ships without it, so the loop runs serially there
+if sys.platform == "win32":
+    openmp_args = ["/openmp"]
+elif sys.platform == "darwin":
+    openmp_args = []
+else:
+    openmp_args = ["-fopenmp"]
+
+extensions = [
+    Extension(
+        "invest_fast",
+        ["invest_fast.pyx"],
+        extra_compile_args=openmp_args,
+        extra_link_args=openmp_args if sys.platform != "win32" else [],
+    ),
+    Extension("gamma_fast", ["gamma_fast.pyx"]),
+]
+
+setup(
+    name="random_variables_fast",
+    ext_modules=cythonize(extensions),
+)
@@ -14,14 +14,18 @@
 # 
 # REQUISITOS:
 # - Python 3.12 o superior
+from concurrent.futures import ThreadPoolExecutor
+import time
 import typer
 from rich.console import Console
+from rich.style import Style
 from rich.text import Text
 from rich.panel import Panel
 from rich.table import Table
 from rich import box
 import yfinance as yf
 import pandas as pd
+import numpy as np
 
 # Objeto Typer: Crea la aplicación de línea de comandos (CLI)
 # Permite definir comandos y opciones que el usuario puede ejecutar desde la terminal
@@ -43,43 +47,48 @@ app = typer.Typer()
 # - Indicadores de estado durante la carga de datos (console.status)
 # - Menús interactivos con formato mejorado
 # - Mensajes informativos y de error al usuario
-console = Console()
+# highlight=False evita el resaltado automático por expresiones regulares en cada
+# texto impreso
+console = Console(highlight=False, markup=True)
+
+# Estilos precompilados para las celdas de las tablas
+# (evitan el parser de markup en cada fila)
+_VERDE = Style(color="green")
+_ROJO = Style(color="red")
+_NEGRITA = Style(bold=True)
 
 # Períodos válidos aceptados por yfinance
-VALID_PERIODS = ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"]
+VALID_PERIODS = ("1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max")
+# Conjunto para validar en O(1) sin reconstruir la lista en cada llamada
+_VALID_PERIODS_SET = frozenset(VALID_PERIODS)
 
 def validar_periodo(period):
     # Valida si el período proporcionado es un período válido de yfinance
-    if not period or not isinstance(period, str):
-        return False
-    return period.lower() in [p.lower() for p in VALID_PERIODS]
+    return isinstance(period, str) and period.lower() in _VALID_PERIODS_SET
 
-def get_stock_metrics(symbol, period):
-    # Valida el período antes de usarlo
-    if not validar_periodo(period):
-        console.print(f"[red]Error: Período '{period}' no es válido.[/red]")
-        console.print(f"[yellow]Períodos válidos: {', '.join(VALID_PERIODS)}[/yellow]")
-        return {}
-    
-    # Obtiene el ticker y el historial de precios
-    ticker = yf.Ticker(symbol)
-    hist = ticker.history(period=period)
-    
+def get_stock_metrics(hist):
+    # Calcula las métricas a partir del historial de precios ya descargado
     # Verifica que haya datos suficientes
     if hist.empty or len(hist) < 2:
         return {}
     
+    # Extrae las columnas como arreglos de numpy una sola vez para evitar
+    # el costo de despacho de pandas en cada agregación
+    # Se usan las versiones nan* para ignorar valores faltantes igual que pandas
+    close = hist["Close"].to_numpy(dtype=np.float64)
+    volume = hist["Volume"].to_numpy(dtype=np.float64)
+    
     # Calcula precios actual y anterior
-    precio_actual = hist["Close"].iloc[-1]
-    precio_anterior = hist["Close"].iloc[-2]
+    precio_actual = close[-1]
+    precio_anterior = close[-2]
     
     # Calcula el cambio y el cambio porcentual
     cambio = precio_actual - precio_anterior
     cambio_porcentual = cambio / precio_anterior if precio_anterior > 0 else 0.0
     
-    # Calcula volatilidad y ratio de Sharpe
-    std_close = hist["Close"].std()
-    mean_close = hist["Close"].mean()
+    # Calcula volatilidad y ratio de Sharpe (desviación estándar muestral, como pandas)
+    std_close = np.nanstd(close, ddof=1)
+    mean_close = np.nanmean(close)
     ratio_sharpe = mean_close / std_close if std_close > 0 else 0.0
     
     # Construye el diccionario con todas las métricas
@@ -87,13 +96,13 @@ def get_stock_metrics(symbol, period):
         "precio": float(precio_actual),
         "cambio": float(cambio),
         "cambioPorcentual": float(cambio_porcentual),
-        "volumen": float(hist["Volume"].iloc[-1]),
-        "volumenPromedio": float(hist["Volume"].mean()),
-        "volumenTotal": float(hist["Volume"].sum()),
+        "volumen": float(volume[-1]),
+        "volumenPromedio": float(np.nanmean(volume)),
+        "volumenTotal": float(np.nansum(volume)),
         "volatilidad": float(std_close),
         "ratioSharpe": float(ratio_sharpe),
-        "maximaGanancia": float(hist["Close"].max()),
-        "maximaPerdida": float(hist["Close"].min()),
+        "maximaGanancia": float(np.nanmax(close)),
+        "maximaPerdida": float(np.nanmin(close)),
     }
     
     # Filtra valores NaN
@@ -101,81 +110,127 @@ def get_stock_metrics(symbol, period):
     
     return result
 
+# Caché de descargas por (símbolo, período): solo guarda respuestas con historial y
+# cada entrada expira tras _CACHE_TTL segundos para no mostrar precios viejos
+_CACHE_TTL = 300
+_CACHE_MAX = 64
+_cache = {}
+
+def _fetch(symbol, period):
+    # Descarga la información y el historial de la acción
+    # Ambas consultas son de red e independientes, así que se hacen en paralelo
+    # (el GIL se libera mientras se espera la respuesta HTTP)
+    ticker = yf.Ticker(symbol)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        fut_info = executor.submit(lambda: ticker.info)
+        fut_hist = executor.submit(ticker.history, period=period)
+        info_dict = fut_info.result()
+        hist = fut_hist.result()
+    return info_dict, hist
+
+def _fetch_cached(symbol, period):
+    # Reutiliza una descarga reciente de la misma acción; si no hay, descarga de nuevo
+    clave = (symbol, period)
+    entrada = _cache.get(clave)
+    if entrada is not None and time.monotonic() - entrada[0] < _CACHE_TTL:
+        return entrada[1], entrada[2]
+    
+    info_dict, hist = _fetch(symbol, period)
+    
+    # Una respuesta vacía puede ser un fallo temporal, así que no se guarda
+    if not hist.empty:
+        _cache.pop(clave, None)
+        if len(_cache) >= _CACHE_MAX:
+            # Descarta la entrada más antigua
+            _cache.pop(next(iter(_cache)))
+        _cache[clave] = (time.monotonic(), info_dict, hist)
+    
+    return info_dict, hist
+
 def get_stock_info(symbol, period):
     # Obtiene información básica de la acción y sus métricas
-    ticker = yf.Ticker(symbol)
+    # Valida el período antes de usarlo
+    if not validar_periodo(period):
+        console.print(f"[red]Error: Período '{period}' no es válido.[/red]")
+        console.print(f"[yellow]Períodos válidos: {', '.join(VALID_PERIODS)}[/yellow]")
+        return {}
+    
+    info_dict, hist = _fetch_cached(symbol, period)
     
     info = {
         "símbolo": symbol,
-        "nombre": ticker.info.get("longName", ticker.info.get("shortName", "N/A")),
-        "sector": ticker.info.get("sector", "N/A"),
-        "industria": ticker.info.get("industry", "N/A"),
-        "país": ticker.info.get("country", "N/A"),
-        "métricas": get_stock_metrics(symbol, period),
+        "nombre": info_dict.get("longName") or info_dict.get("shortName", "N/A"),
+        "sector": info_dict.get("sector", "N/A"),
+        "industria": info_dict.get("industry", "N/A"),
+        "país": info_dict.get("country", "N/A"),
+        "métricas": get_stock_metrics(hist),
     }
     
     return info
 
-def bienvenida():
-    # Muestra el mensaje de bienvenida de la aplicación
-    titulo = Text(
-        "getStockInfo",
-        style="bold",
-        justify="center",
-    )
-    
-    subtitle = Text(
-        "Desarrollado con yfinance, typer y rich", 
+# Paneles estáticos: se construyen una sola vez al importar el módulo y se reutilizan
+# en cada llamada a bienvenida() y mostrar_ayuda()
+_TITULO_BIENVENIDA = Text(
+    "getStockInfo",
+    style="bold",
+    justify="center",
+)
+
+_SUBTITULO_BIENVENIDA = Text(
+    "Desarrollado con yfinance, typer y rich", 
+    style="bold", 
+    justify="center"
+)
+
+_PANEL_BIENVENIDA = Panel(
+    Text(
+        "Utiliza esta herramienta para obtener un resumen rápido de cualquier acción en la bolsa.", 
         style="bold", 
         justify="center"
-    )
-    
-    panel = Panel(
-        Text(
-            "Utiliza esta herramienta para obtener un resumen rápido de cualquier acción en la bolsa.", 
-            style="bold", 
-            justify="center"
-        ),
-        title=titulo, 
-        subtitle=subtitle,
-        border_style="blue", 
-        width=80
-    )
+    ),
+    title=_TITULO_BIENVENIDA, 
+    subtitle=_SUBTITULO_BIENVENIDA,
+    border_style="blue", 
+    width=80
+)
 
-    console.print(panel)
+_PANEL_AYUDA = Panel(
+    Text(
+        "Para encontrar el símbolo de una acción, puedes buscar en:\n\n"
+        "• Yahoo Finance: https://finance.yahoo.com/\n"
+        "  - Busca el nombre de la empresa y encontrarás su símbolo\n"
+        "  - Ejemplo: 'Apple' → AAPL\n\n"
+        "• Google Finance: https://www.google.com/finance/\n"
+        "  - Similar a Yahoo Finance, con búsqueda de empresas\n\n"
+        "• MarketWatch: https://www.marketwatch.com/\n"
+        "  - Incluye búsqueda de símbolos y listados completos\n\n"
+        "Ejemplos de símbolos comunes:\n"
+        "• AAPL - Apple Inc.\n"
+        "• MSFT - Microsoft Corporation\n"
+        "• GOOGL - Alphabet Inc. (Google)\n"
+        "• TSLA - Tesla, Inc.\n"
+        "• AMZN - Amazon.com, Inc.\n"
+        "• META - Meta Platforms Inc. (Facebook)\n\n"
+        "Nota: Los símbolos deben estar en mayúsculas y corresponder\n"
+        "a acciones listadas en bolsas de valores como NYSE, NASDAQ, etc.",
+        style="white",
+        justify="left"
+    ),
+    title=Text.from_markup("[bold cyan]Ayuda: Cómo encontrar símbolos de acciones[/bold cyan]"),
+    border_style="yellow",
+    width=90
+)
+
+
+def bienvenida():
+    # Muestra el mensaje de bienvenida de la aplicación
+    console.print(_PANEL_BIENVENIDA)
 
 
 def mostrar_ayuda():
     # Muestra información de ayuda sobre cómo encontrar símbolos de acciones
-    ayuda_panel = Panel(
-        Text(
-            "Para encontrar el símbolo de una acción, puedes buscar en:\n\n"
-            "• Yahoo Finance: https://finance.yahoo.com/\n"
-            "  - Busca el nombre de la empresa y encontrarás su símbolo\n"
-            "  - Ejemplo: 'Apple' → AAPL\n\n"
-            "• Google Finance: https://www.google.com/finance/\n"
-            "  - Similar a Yahoo Finance, con búsqueda de empresas\n\n"
-            "• MarketWatch: https://www.marketwatch.com/\n"
-            "  - Incluye búsqueda de símbolos y listados completos\n\n"
-            "Ejemplos de símbolos comunes:\n"
-            "• AAPL - Apple Inc.\n"
-            "• MSFT - Microsoft Corporation\n"
-            "• GOOGL - Alphabet Inc. (Google)\n"
-            "• TSLA - Tesla, Inc.\n"
-            "• AMZN - Amazon.com, Inc.\n"
-            "• META - Meta Platforms Inc. (Facebook)\n\n"
-            "Nota: Los símbolos deben estar en mayúsculas y corresponder\n"
-            "a acciones listadas en bolsas de valores como NYSE, NASDAQ, etc.",
-            style="white",
-            justify="left"
-        ),
-        title="[bold cyan]Ayuda: Cómo encontrar símbolos de acciones[/bold cyan]",
-        border_style="yellow",
-        width=90
-    )
-    
     console.print()
-    console.print(ayuda_panel)
+    console.print(_PANEL_AYUDA)
     console.print()
     console.print("[bold]Presiona Enter para continuar...[/bold]")
     input()
@@ -183,17 +238,16 @@ def mostrar_ayuda():
 
 def validar_stock_data(stock_data):
     # Valida que los datos de la acción sean válidos
-    if stock_data is None:
+    if not stock_data:
         return False
     
-    # Verifica que tenga nombre válido y métricas
-    nombre = stock_data.get('nombre', 'N/A')
-    metricas = stock_data.get('métricas', {})
-    
-    tiene_nombre_valido = nombre != "N/A" and nombre.strip() != ""
-    tiene_metricas = len(metricas) > 0
+    # Verifica primero las métricas (revisar si el diccionario está vacío es lo más barato)
+    if not stock_data.get('métricas'):
+        return False
     
-    return tiene_nombre_valido and tiene_metricas
+    # Verifica que tenga nombre válido sin crear una cadena nueva con strip()
+    nombre = stock_data.get('nombre', 'N/A')
+    return nombre != "N/A" and bool(nombre) and not nombre.isspace()
 
 
 def obtener_stock_valido(symbol, period):
@@ -222,6 +276,19 @@ def obtener_stock_valido(symbol, period):
                 return None
 
 
+def _nueva_tabla(titulo, columna):
+    # Crea una tabla vacía con el formato común de la aplicación (columnas campo/valor)
+    tabla = Table(
+        title=titulo,
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold magenta",
+    )
+    tabla.add_column(columna, style="cyan", no_wrap=True)
+    tabla.add_column("Valor", style="green")
+    return tabla
+
+
 def mostrar_info_basica(stock_data):
     # Muestra solo la información básica de la acción (sin métricas)
     symbol = stock_data.get('símbolo', 'N/A').upper()
@@ -231,9 +298,7 @@ def mostrar_info_basica(stock_data):
     pais = stock_data.get('país', 'N/A')
     
     # Crea y muestra la tabla con la información básica
-    tabla_info = Table(title=f"Información de {symbol}", box=box.ROUNDED, show_header=True, header_style="bold magenta")
-    tabla_info.add_column("Campo", style="cyan", no_wrap=True)
-    tabla_info.add_column("Valor", style="green")
+    tabla_info = _nueva_tabla(f"Información de {symbol}", "Campo")
     tabla_info.add_row("Nombre", nombre)
     tabla_info.add_row("Símbolo", symbol)
     tabla_info.add_row("Sector", sector)
@@ -342,9 +407,7 @@ def mostrar_resumen(stock_data, metricas_seleccionadas=None, mostrar_info_basica
         metricas_seleccionadas = ["precios", "volumen", "riesgo"]
     
     # Crea la tabla de métricas
-    tabla_info = Table(title=f"Métricas de {symbol}", box=box.ROUNDED, show_header=True, header_style="bold magenta")
-    tabla_info.add_column("Métrica", style="cyan", no_wrap=True)
-    tabla_info.add_column("Valor", style="green")
+    tabla_info = _nueva_tabla(f"Métricas de {symbol}", "Métrica")
     
     # Agrega información básica si se solicita
     if mostrar_info_basica:
@@ -361,7 +424,7 @@ def mostrar_resumen(stock_data, metricas_seleccionadas=None, mostrar_info_basica
         # Métricas de precios
         if "precios" in metricas_seleccionadas:
             tabla_info.add_row("", "")
-            tabla_info.add_row("[bold]Precios[/bold]", "")
+            tabla_info.add_row(Text("Precios", style=_NEGRITA), "")
             
             precio = metricas.get('precio', 0.0)
             cambio = metricas.get('cambio', 0.0)
@@ -377,8 +440,9 @@ def mostrar_resumen(stock_data, metricas_seleccionadas=None, mostrar_info_basica
                 tabla_info.add_row("Precio Anterior", f"${precio_anterior:.2f}")
             
             # Muestra el cambio con color (verde si sube, rojo si baja)
-            color_cambio = "green" if cambio >= 0 else "red"
-            tabla_info.add_row("Cambio", f"[{color_cambio}]{cambio:+.2f} ({cambio_porcentual*100:+.2f}%)[/{color_cambio}]")
+            estilo_cambio = _VERDE if cambio >= 0 else _ROJO
+            texto_cambio = f"{cambio:+.2f} ({cambio_porcentual*100:+.2f}%)"
+            tabla_info.add_row("Cambio", Text(texto_cambio, style=estilo_cambio))
             tabla_info.add_row("Precio Máximo", f"${maxima_ganancia:.2f}")
             tabla_info.add_row("Precio Mínimo", f"${maxima_perdida:.2f}")
         
@@ -389,7 +453,7 @@ def mostrar_resumen(stock_data, metricas_seleccionadas=None, mostrar_info_basica
             volumen_total = metricas.get('volumenTotal', 0.0)
             
             tabla_info.add_row("", "")
-            tabla_info.add_row("[bold]Volumen[/bold]", "")
+            tabla_info.add_row(Text("Volumen", style=_NEGRITA), "")
             tabla_info.add_row("Volumen Actual", f"{volumen:,.0f}")
             tabla_info.add_row("Volumen Promedio", f"{volumen_promedio:,.0f}")
             tabla_info.add_row("Volumen Total", f"{volumen_total:,.0f}")
@@ -401,11 +465,14 @@ def mostrar_resumen(stock_data, metricas_seleccionadas=None, mostrar_info_basica
             ratio_sharpe = metricas.get('ratioSharpe', 0.0)
             
             tabla_info.add_row("", "")
-            tabla_info.add_row("[bold]Rendimientos y Riesgo[/bold]", "")
+            tabla_info.add_row(Text("Rendimientos y Riesgo", style=_NEGRITA), "")
             
             # Muestra el retorno diario con color
-            color_retorno = "green" if cambio_porcentual >= 0 else "red"
-            tabla_info.add_row("Retorno Diario", f"[{color_retorno}]{cambio_porcentual*100:+.2f}%[/{color_retorno}]")
+            estilo_retorno = _VERDE if cambio_porcentual >= 0 else _ROJO
+            texto_retorno = f"{cambio_porcentual*100:+.2f}%"
+            tabla_info.add_row(
+                "Retorno Diario", Text(texto_retorno, style=estilo_retorno)
+            )
             
             # Volatilidad (desviación estándar de precios)
             tabla_info.add_row("Volatilidad (Desv. Est.)", f"${volatilidad:.2f}")